@@ -12,13 +12,11 @@ python example_usage.py
 from web_reader_local import LocalWebReader, Website
 import time
 
-def demonstrate_basic_usage():
+def demonstrate_basic_usage(reader):
     """Basic web analysis demonstration."""
     print("🔍 BASIC WEB ANALYSIS")
     print("=" * 50)
     
-    reader = LocalWebReader()
-    
     # Example: News article analysis
     url = "https://www.cnn.com/2025/08/30/politics/zohran-mamdani-police-nypd-defund"
     print(f"Analyzing: {url}")
@@ -33,14 +31,13 @@ def demonstrate_basic_usage():
     print(f"💰 Cost: $0 (vs $0.02-0.05 with cloud APIs)")
     print("\n" + "="*70 + "\n")
 
-def demonstrate_custom_prompts():
+def demonstrate_custom_prompts(reader):
     """Show how to customize analysis for different business needs."""
     print("🎯 CUSTOM BUSINESS ANALYSIS")
     print("=" * 50)
     
-    reader = LocalWebReader()
-    
-    # Business-focused analysis
+    # Business-focused analysis (restored afterwards; the reader is shared)
+    default_prompt = reader.system_prompt
     reader.set_system_prompt("""
     You are a business intelligence analyst. Focus on:
     - Key business metrics and financial information
@@ -56,17 +53,18 @@ def demonstrate_custom_prompts():
     print(f"Business Analysis of: {url}")
     print("-" * 50)
     
-    summary = reader.summarize(url)
+    try:
+        summary = reader.summarize(url)
+    finally:
+        reader.set_system_prompt(default_prompt)
     print(summary)
     print("\n" + "="*70 + "\n")
 
-def demonstrate_batch_processing():
+def demonstrate_batch_processing(reader):
     """Show batch processing capabilities for enterprise use."""
     print("📊 BATCH PROCESSING DEMO")
     print("=" * 50)
     
-    reader = LocalWebReader()
-    
     # Multiple URLs for analysis
     urls = [
         "https://techcrunch.com",
@@ -92,13 +90,11 @@ def demonstrate_batch_processing():
     print(f"📈 Cost savings: 100%")
     print("\n" + "="*70 + "\n")
 
-def demonstrate_error_handling():
+def demonstrate_error_handling(reader):
     """Show robust error handling capabilities."""
     print("🛡️ ERROR HANDLING DEMO")
     print("=" * 50)
     
-    reader = LocalWebReader()
-    
     # Test with invalid URL
     invalid_url = "https://this-website-definitely-does-not-exist.com"
     print(f"Testing with invalid URL: {invalid_url}")
@@ -145,11 +141,15 @@ def main():
     print()
     
     try:
+        # One shared reader: Ollama is probed once and the model loaded once
+        reader = LocalWebReader()
+        reader.warm_up()
+        
         # Run all demonstrations
-        demonstrate_basic_usage()
-        demonstrate_custom_prompts()
-        demonstrate_batch_processing()
-        demonstrate_error_handling()
+        demonstrate_basic_usage(reader)
+        demonstrate_custom_prompts(reader)
+        demonstrate_batch_processing(reader)
+        demonstrate_error_handling(reader)
         show_cost_comparison()
         
         print("🎉 DEMO COMPLETE")
@@ -162,7 +162,7 @@ def main():
         print(f"❌ Demo error: {str(e)}")
         print("💡 Ensure Ollama is installed and running:")
         print("   1. Install Ollama from https://ollama.ai")
-        print("   2. Run: ollama pull llama3.2")
+        print("   2. Run: ollama pull llama3.2:3b-instruct-q4_K_M")
         print("   3. Run: ollama serve")
 
 if __name__ == "__main__":